@@ -5,14 +5,25 @@
 """
 
 import argparse
+import json
 import os
 import re
 import subprocess
 import sys
 import tempfile
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Optional, Tuple, List, Dict
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
 
 
 class GitPlatform:
@@ -23,6 +34,171 @@ class GitPlatform:
     ATOMGIT = "atomgit"
 
 
+@dataclass(frozen=True)
+class PlatformConfig:
+    """平台相关配置"""
+
+    api_base: str
+    accept: str
+    domain: str
+
+
+@dataclass(frozen=True)
+class _PushTarget:
+    """推送目标"""
+
+    remote: str
+    label: str
+    repo: str
+    domain: str
+
+    @property
+    def transport_key(self) -> str:
+        """推送传输方式记录的键"""
+        return f"{self.domain}/{self.repo}"
+
+
+# api_base不带末尾的"/"
+PLATFORMS: Dict[str, PlatformConfig] = {
+    GitPlatform.GITHUB: PlatformConfig("https://api.github.com", "application/vnd.github.v3+json", "github.com"),
+    GitPlatform.GITEE: PlatformConfig("https://gitee.com/api/v5", "application/json;charset=UTF-8", "gitee.com"),
+    GitPlatform.ATOMGIT: PlatformConfig(
+        "https://api.atomgit.com/api/v5", "application/json;charset=UTF-8", "atomgit.com"
+    ),
+}
+
+# API请求超时时间 (连接, 读取)，单位秒
+_API_TIMEOUT = (5, 30)
+
+# GitHub PR描述的最大长度
+_PR_BODY_MAX_LENGTH = 65536
+
+# 克隆选项：部分克隆，只下载提交和树对象，文件内容在需要时按需获取
+_CLONE_OPTIONS = ["--filter=blob:none", "--no-tags"]
+
+# 只读的git命令
+_READ_ONLY_GIT_COMMANDS = frozenset(
+    {
+        "log",
+        "show",
+        "ls-remote",
+        "remote",
+        "merge-base",
+        "fetch",
+        "clone",
+        "status",
+        "diff",
+        "rev-parse",
+        "symbolic-ref",
+        "cat-file",
+    }
+)
+# 环境设置命令（在dry-run模式下应该执行的命令）
+_SETUP_GIT_COMMANDS = frozenset({"clone", "remote", "fetch"})
+# dry-run模式下仍然实际执行的命令
+_DRY_RUN_EXEC_GIT_COMMANDS = _READ_ONLY_GIT_COMMANDS | _SETUP_GIT_COMMANDS
+
+# URL中认证信息（https://<auth>@host/...）的匹配规则
+_AUTH_URL_RE = re.compile(r"^https://[^@]*@")
+
+# 分支名中需要替换为"-"的字符（包括"/"）
+_SANITIZE_BRANCH = re.compile(r"[^\w\-]")
+
+# PR链接匹配规则，模块加载时预编译
+_PR_PATTERNS = [
+    (GitPlatform.GITHUB, re.compile(r"https?://github\.com/([^/]+)/([^/]+)/pull/(\d+)")),
+    (GitPlatform.GITEE, re.compile(r"https?://gitee\.com/([^/]+)/([^/]+)/pulls/(\d+)")),
+    (GitPlatform.ATOMGIT, re.compile(r"https?://atomgit\.com/([^/]+)/([^/]+)/pulls/(\d+)")),
+]
+
+
+# 提交列表最多显示的行数，提交较多时按间隔抽样显示
+_LISTING_MAX_LINES = 100
+
+
+def _format_commit_listing(commits: List[Tuple[str, str]]) -> str:
+    """
+    格式化带编号的提交列表，commits为 [(SHA, 标题)]
+    提交较多时只显示首尾提交和每隔report_every个的提交，输出行数不随提交数量增长
+    """
+    # 向上取整，抽样的行数不超过_LISTING_MAX_LINES(另加末尾提交)
+    report_every = -(-len(commits) // _LISTING_MAX_LINES)
+    lines = [
+        f"  {i}. {sha[:8]} - {subject}"
+        for i, (sha, subject) in enumerate(commits, 1)
+        if i == 1 or i == len(commits) or i % report_every == 0
+    ]
+    if report_every > 1:
+        lines.append(f"  (共 {len(commits)} 个提交，每 {report_every} 个显示一个)")
+    return "\n".join(lines)
+
+
+def _fast_rmtree(path: str):
+    """
+    基于os.scandir的目录删除
+    复用DirEntry缓存的类型信息，省去shutil.rmtree对每个条目额外的lstat
+    """
+    try:
+        entries = list(os.scandir(path))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+        except PermissionError:
+            # Windows下.git/objects中的只读文件需要先去掉只读属性
+            os.chmod(entry.path, stat.S_IWRITE)
+            os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+    os.rmdir(path)
+
+
+def _remove_tree(path: str):
+    """
+    删除目录树
+    POSIX系统上优先使用rm -rf，否则使用_fast_rmtree
+    """
+    rm = shutil.which("rm") if os.name == "posix" else None
+    if rm:
+        result = subprocess.run([rm, "-rf", "--", path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if result.returncode == 0:
+            return
+    try:
+        _fast_rmtree(path)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+# 记录各推送目标可用的传输方式（https/ssh），跨运行复用
+_PUSH_TRANSPORT_FILE = os.path.join(
+    os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config"), "git-sync-pr", "transport.json"
+)
+
+
+def _load_push_transports() -> Dict[str, str]:
+    """读取推送传输方式记录，文件不存在或损坏时返回空记录"""
+    try:
+        with open(_PUSH_TRANSPORT_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_push_transports(transports: Dict[str, str]):
+    """保存推送传输方式记录，失败时忽略"""
+    try:
+        os.makedirs(os.path.dirname(_PUSH_TRANSPORT_FILE), exist_ok=True)
+        with open(_PUSH_TRANSPORT_FILE, "w", encoding="utf-8") as f:
+            json.dump(transports, f, indent=2)
+    except OSError:
+        pass
+
+
 class CherryPickBot:
     def __init__(self, token: Optional[str] = None, dry_run: bool = False, auto_confirm: bool = False):
         self.token = token
@@ -37,84 +213,88 @@ class CherryPickBot:
         self.pr_base_ref = None
         self.pr_head_commit = None
         self.pr_base_commit = None
+        # 最近一次cherry-pick时，所有提交是否均已存在于目标分支（无需cherry-pick）
+        self.nothing_to_pick = False
         self.source_remote_name = "pr-source"
         self.personal_repo = None
         self.personal_remote_name = "personal"
         self.working_dir = None
         self.is_temp_dir = False
+        self._temp_dir: Optional[tempfile.TemporaryDirectory] = None
         self.original_cwd = os.getcwd()
         self.using_existing_repo = False
-
-    def __del__(self):
-        """清理临时目录"""
+        self._session = self._create_session()
+        self._pr_info_cache: Optional[Dict] = None
+        self._pr_info_cache_key: Optional[Tuple] = None
+        self._remotes_cache: Optional[Dict[str, str]] = None
+        self._remote_heads: Dict[str, Dict[str, str]] = {}
+        self._commit_subjects: Dict[str, str] = {}
+        self._default_branch: Optional[str] = None
+        self._cherry_pick_head_path: Optional[str] = None
+        self._push_transports: Optional[Dict[str, str]] = None
+        self._push_target: Optional[_PushTarget] = None
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]):
+        """设置token时同步预编译用于日志脱敏的正则"""
+        self._token = value
+        self._token_re = re.compile(re.escape(value)) if value else None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info):
+        """退出上下文时清理临时目录"""
         self.cleanup()
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        创建复用连接的HTTP会话
+        对429和临时性5xx错误自动重试，并遵循Retry-After头
+        """
+        session = requests.Session()
+        session.headers.update({"User-Agent": "git-sync-pr"})
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def parse_pr_url(self, pr_url: str) -> Tuple[str, str, str, int]:
         """
         解析PR链接，提取平台、仓库所有者、仓库名和PR编号
         """
-        github_pattern = r"https?://github\.com/([^/]+)/([^/]+)/pull/(\d+)"
-        gitee_pattern = r"https?://gitee\.com/([^/]+)/([^/]+)/pulls/(\d+)"
-        atomgit_pattern = r"https?://atomgit\.com/([^/]+)/([^/]+)/pulls/(\d+)"
-
-        github_match = re.match(github_pattern, pr_url)
-        if github_match:
-            self.platform = GitPlatform.GITHUB
-            self.repo_owner, self.repo_name, pr_num = github_match.groups()
-            self.pr_number = int(pr_num)
-            return self.platform, self.repo_owner, self.repo_name, self.pr_number
-
-        gitee_match = re.match(gitee_pattern, pr_url)
-        if gitee_match:
-            self.platform = GitPlatform.GITEE
-            self.repo_owner, self.repo_name, pr_num = gitee_match.groups()
-            self.pr_number = int(pr_num)
-            return self.platform, self.repo_owner, self.repo_name, self.pr_number
-
-        atomgit_match = re.match(atomgit_pattern, pr_url)
-        if atomgit_match:
-            self.platform = GitPlatform.ATOMGIT
-            self.repo_owner, self.repo_name, pr_num = atomgit_match.groups()
-            self.pr_number = int(pr_num)
-            return self.platform, self.repo_owner, self.repo_name, self.pr_number
+        for platform, pattern in _PR_PATTERNS:
+            match = pattern.match(pr_url)
+            if match:
+                self.platform = platform
+                self.repo_owner, self.repo_name, pr_num = match.groups()
+                self.pr_number = int(pr_num)
+                return self.platform, self.repo_owner, self.repo_name, self.pr_number
 
         raise ValueError(f"不支持的PR链接格式: {pr_url}")
 
     def _get_api_url_base(self, platform):
-        url_base = {
-            GitPlatform.GITHUB: "https://api.github.com",
-            GitPlatform.GITEE: "https://gitee.com/api/v5",
-            GitPlatform.ATOMGIT: "https://api.atomgit.com/api/v5",
-        }
-        url = url_base.get(platform)
-        if url:
-            url = url.rstrip("/")
-        return url
+        return PLATFORMS[platform].api_base
 
     def _get_api_header_accept(self, platform):
-        headers = {
-            GitPlatform.GITHUB: "application/vnd.github.v3+json",
-            GitPlatform.GITEE: "application/json;charset=UTF-8",
-            GitPlatform.ATOMGIT: "application/json;charset=UTF-8",
-        }
-        return headers[platform]
+        return PLATFORMS[platform].accept
 
     def _get_remote_domain(self, platform):
-        domains = {
-            GitPlatform.GITHUB: "github.com",
-            GitPlatform.GITEE: "gitee.com",
-            GitPlatform.ATOMGIT: "atomgit.com",
-        }
-        ret = domains.get(platform)
-        if not ret:
-            print(f"不支持的平台：{self.platform}")
-        return ret
+        return PLATFORMS[platform].domain
 
-    def _get_repo_remote_url(self, platform, target_repo, token=None, http=False) -> Optional[str]:
+    def _get_repo_remote_url(self, platform, target_repo, token=None, http=False) -> str:
         target_domain = self._get_remote_domain(platform)
-        if not target_domain:
-            return None
-
         scheme = "https"
         if http:
             scheme = "http"
@@ -125,19 +305,76 @@ class CherryPickBot:
 
         return repo_url
 
-    def _get_repo_remote_ssh_url(self, platform, target_repo) -> Optional[str]:
-        target_domain = self._get_remote_domain(platform)
-        if not target_domain:
-            return None
+    def _get_repo_remote_ssh_url(self, platform, target_repo) -> str:
+        return f"git@{self._get_remote_domain(platform)}:{target_repo}.git"
 
-        return f"git@{target_domain}:{target_repo}.git"
+    @staticmethod
+    def _parse_remotes(output: str) -> Dict[str, str]:
+        """解析git remote -v的输出，返回远程名称到fetch URL的映射"""
+        remotes: Dict[str, str] = {}
+        for line in output.splitlines():
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "(fetch)":
+                remotes.setdefault(parts[0], parts[1])
+        return remotes
+
+    def _get_remotes(self) -> Dict[str, str]:
+        """
+        获取远程仓库配置
+        只执行一次git remote -v并缓存，增删改远程后需清空缓存
+        """
+        if self._remotes_cache is None:
+            result = self.run_git_command(["git", "remote", "-v"])
+            self._remotes_cache = self._parse_remotes(result.stdout) if result.returncode == 0 else {}
+        return self._remotes_cache
+
+    def _get_remote_heads(self, remote: str) -> Optional[Dict[str, str]]:
+        """
+        获取远程仓库的分支映射 {分支名: SHA}
+        每个远程只执行一次git ls-remote --heads并缓存
+        获取失败（例如认证或网络错误）时返回None且不缓存，下次调用重试
+        """
+        if remote not in self._remote_heads:
+            result = self.run_git_command(["git", "ls-remote", "--heads", remote])
+            if result.returncode != 0:
+                return None
+            heads: Dict[str, str] = {}
+            for line in result.stdout.splitlines():
+                parts = line.split()
+                if len(parts) == 2 and parts[1].startswith("refs/heads/"):
+                    heads[parts[1][len("refs/heads/") :]] = parts[0]
+            self._remote_heads[remote] = heads
+        return self._remote_heads[remote]
+
+    @property
+    def default_branch(self) -> Optional[str]:
+        """
+        目标仓库(origin)的默认分支
+        只解析一次并缓存，重新克隆时失效
+        """
+        if self._default_branch is None:
+            result = self.run_git_command(["git", "symbolic-ref", "--short", "refs/remotes/origin/HEAD"])
+            if result.returncode == 0 and result.stdout.strip():
+                # 只去掉第一段远程名，保留分支名中的斜杠: origin/release/1.x -> release/1.x
+                self._default_branch = result.stdout.strip().partition("/")[2]
+            else:
+                # 现有仓库可能没有origin/HEAD，向远程查询
+                result = self.run_git_command(["git", "ls-remote", "--symref", "origin", "HEAD"])
+                for line in result.stdout.splitlines() if result.returncode == 0 else []:
+                    if line.startswith("ref: refs/heads/"):
+                        self._default_branch = line.split()[1][len("refs/heads/") :]
+                        break
+        return self._default_branch
 
     def cleanup(self):
         """清理资源"""
         if self.working_dir and self.is_temp_dir and os.path.exists(self.working_dir):
-            if not self.dry_run:
-                print(f"🧹 清理临时目录: {self.working_dir}")
-                shutil.rmtree(self.working_dir, ignore_errors=True)
+            print(f"🧹 清理临时目录: {self.working_dir}")
+            _remove_tree(self.working_dir)
+        if self._temp_dir is not None:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
+        self._session.close()
 
     def hide_token_in_url(self, url: str) -> str:
         """
@@ -147,27 +384,15 @@ class CherryPickBot:
         if not url:
             return url
 
-        # 检查URL是否包含token
-        if self.token and self.token in url:
-            # 替换token为[TOKEN_HIDDEN]
-            hidden_url = url.replace(self.token, "[TOKEN_HIDDEN]")
-            return hidden_url
+        # 检查URL是否包含token，替换为[TOKEN_HIDDEN]
+        if self._token_re:
+            hidden_url, count = self._token_re.subn("[TOKEN_HIDDEN]", url)
+            if count:
+                return hidden_url
 
         # 检查是否是HTTPS URL且包含@符号（可能是认证信息）
-        if url.startswith("https://") and "@" in url:
-            # 格式: https://token@host/path
-            parts = url.split("@", 1)
-            if len(parts) == 2:
-                prefix, suffix = parts
-                # 替换@前面的部分
-                if "://" in prefix:
-                    protocol, _ = prefix.split("://", 1)
-                    safe_url = f"{protocol}://[AUTH_HIDDEN]@{suffix}"
-                else:
-                    safe_url = f"[AUTH_HIDDEN]@{suffix}"
-                return safe_url
-
-        return url
+        # 格式: https://token@host/path，替换@前面的部分
+        return _AUTH_URL_RE.sub("https://[AUTH_HIDDEN]@", url, count=1)
 
     def remove_sensitive_remotes(self) -> bool:
         """
@@ -175,10 +400,9 @@ class CherryPickBot:
         在使用现有仓库时特别重要，防止敏感信息泄露
         返回是否成功
         """
-        if not self.using_existing_repo or self.dry_run:
-            # 如果不是使用现有仓库，或者是在dry-run模式下，不需要删除
-            if self.dry_run and self.using_existing_repo:
-                print(f"[DRY-RUN] 将删除可能包含token的远程仓库")
+        if not self.using_existing_repo:
+            # 如果不是使用现有仓库，不需要删除
+            # dry-run模式下远程同样会被实际设置，因此也需要清理
             return True
 
         print("🔐 清理可能包含token的远程仓库...")
@@ -189,41 +413,39 @@ class CherryPickBot:
                 print(f"⚠️ 当前目录不是Git仓库，无法清理远程仓库")
                 return True
 
-            # 切换到工作目录
-            original_dir = os.getcwd()
-            os.chdir(self.working_dir or str())
-
-            try:
-                # 定义需要检查的远程仓库名称
-                remotes_to_check = [self.source_remote_name]
-                if self.personal_remote_name:
-                    remotes_to_check.append(self.personal_remote_name)
-
-                for remote in remotes_to_check:
-                    # 检查远程是否存在
-                    result = subprocess.run(["git", "remote", "get-url", remote], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        remote_url = result.stdout.strip()
-                        # 检查URL是否包含token
-                        if self.token and self.token in remote_url:
-                            print(f"⚠️ 检测到远程 '{remote}' 包含token，正在删除...")
-                            # 删除远程仓库
-                            result = subprocess.run(["git", "remote", "remove", remote], capture_output=True, text=True)
-                            if result.returncode == 0:
-                                print(f"✅ 已删除远程仓库: {remote}")
-                            else:
-                                print(f"❌ 删除远程仓库失败: {result.stderr}")
-                        elif remote_url.startswith("https://") and "@" in remote_url:
-                            # URL包含@符号，可能是token或密码
-                            print(f"⚠️ 检测到远程 '{remote}' 可能包含认证信息，正在删除...")
-                            result = subprocess.run(["git", "remote", "remove", remote], capture_output=True, text=True)
-                            if result.returncode == 0:
-                                print(f"✅ 已删除远程仓库: {remote}")
-                            else:
-                                print(f"❌ 删除远程仓库失败: {result.stderr}")
-            finally:
-                # 切回原始目录
-                os.chdir(original_dir)
+            # 定义需要检查的远程仓库名称
+            remotes_to_check = [self.source_remote_name]
+            if self.personal_remote_name:
+                remotes_to_check.append(self.personal_remote_name)
+
+            remotes = self._get_remotes()
+            for remote in remotes_to_check:
+                # 检查远程是否存在
+                remote_url = remotes.get(remote)
+                if remote_url:
+                    # 检查URL是否包含token
+                    if self.token and self.token in remote_url:
+                        print(f"⚠️ 检测到远程 '{remote}' 包含token，正在删除...")
+                        # 删除远程仓库
+                        result = self.run_git_command(
+                            ["git", "remote", "remove", remote], cwd=self.working_dir, capture_stdout=False
+                        )
+                        self._remotes_cache = None
+                        if result.returncode == 0:
+                            print(f"✅ 已删除远程仓库: {remote}")
+                        else:
+                            print(f"❌ 删除远程仓库失败: {result.stderr}")
+                    elif remote_url.startswith("https://") and "@" in remote_url:
+                        # URL包含@符号，可能是token或密码
+                        print(f"⚠️ 检测到远程 '{remote}' 可能包含认证信息，正在删除...")
+                        result = self.run_git_command(
+                            ["git", "remote", "remove", remote], cwd=self.working_dir, capture_stdout=False
+                        )
+                        self._remotes_cache = None
+                        if result.returncode == 0:
+                            print(f"✅ 已删除远程仓库: {remote}")
+                        else:
+                            print(f"❌ 删除远程仓库失败: {result.stderr}")
 
             return True
 
@@ -235,7 +457,12 @@ class CherryPickBot:
         """
         通过API获取PR的详细信息，包括标题、描述、head和base分支
         使用Bearer认证
+        同一PR的响应在实例内缓存，避免重复请求
         """
+        cache_key = (self.platform, self.repo_owner, self.repo_name, self.pr_number)
+        if self._pr_info_cache is not None and self._pr_info_cache_key == cache_key:
+            return self._pr_info_cache
+
         api_url = (
             f"{self._get_api_url_base(self.platform)}/repos/{self.repo_owner}/{self.repo_name}/pulls/{self.pr_number}"
         )
@@ -244,10 +471,12 @@ class CherryPickBot:
             headers["Authorization"] = f"Bearer {self.token}"
 
         try:
-            response = requests.get(api_url, headers=headers)
+            response = self._session.get(api_url, headers=headers, timeout=_API_TIMEOUT)
             response.raise_for_status()
             pr_data = response.json()
 
+            self._pr_info_cache = pr_data
+            self._pr_info_cache_key = cache_key
             return pr_data
 
         except requests.RequestException as e:
@@ -272,11 +501,19 @@ class CherryPickBot:
             "base_ref": base_ref,
             "head_commit_sha": head_commit_sha,
             "base_commit_sha": base_commit_sha,
-            "title": pr_info.get("title", ""),
-            "body": pr_info.get("body", ""),
+            "title": pr_info.get("title") or "",
+            "body": pr_info.get("body") or "",
             "pr_info": pr_info,
         }
 
+    def _create_temp_working_dir(self):
+        """创建临时工作目录，由TemporaryDirectory兜底清理"""
+        self._temp_dir = tempfile.TemporaryDirectory(prefix="cherry_pick_")
+        print(f"📁 创建临时工作目录: {self._temp_dir.name}")
+        self.working_dir = self._temp_dir.name
+        self.is_temp_dir = True
+        self.using_existing_repo = False
+
     def setup_working_directory(self, repo_path: Optional[str]) -> bool:
         """
         设置工作目录
@@ -284,21 +521,18 @@ class CherryPickBot:
         如果repo_path是Git仓库，则使用它
         否则在临时目录中工作
         """
+        self._cherry_pick_head_path = None
         try:
+            # dry-run模式下同样准备工作目录，只读命令和环境设置命令需要在其中实际执行
             if self.dry_run:
                 if repo_path is None:
                     print(f"[DRY-RUN] 将在临时目录中工作")
                 else:
                     print(f"[DRY-RUN] 将设置工作目录: {repo_path}")
-                return True
 
             # 如果repo_path是None，创建临时目录
             if repo_path is None:
-                temp_dir = tempfile.mkdtemp(prefix="cherry_pick_")
-                print(f"📁 创建临时工作目录: {temp_dir}")
-                self.working_dir = temp_dir
-                self.is_temp_dir = True
-                self.using_existing_repo = False
+                self._create_temp_working_dir()
                 return True
 
             # 检查repo_path是否是有效的Git仓库
@@ -317,70 +551,84 @@ class CherryPickBot:
                 print(f"⚠️ 路径 '{repo_path}' 不是Git仓库，将在临时目录中工作")
 
                 # 创建临时目录
-                temp_dir = tempfile.mkdtemp(prefix="cherry_pick_")
-                print(f"📁 创建临时工作目录: {temp_dir}")
-                self.working_dir = temp_dir
-                self.is_temp_dir = True
-                self.using_existing_repo = False
+                self._create_temp_working_dir()
                 return True
             else:
                 # 路径不存在
                 print(f"⚠️ 路径 '{repo_path}' 不存在，将在临时目录中工作")
 
                 # 创建临时目录
-                temp_dir = tempfile.mkdtemp(prefix="cherry_pick_")
-                print(f"📁 创建临时工作目录: {temp_dir}")
-                self.working_dir = temp_dir
-                self.is_temp_dir = True
-                self.using_existing_repo = False
+                self._create_temp_working_dir()
                 return True
 
         except Exception as e:
             print(f"❌ 设置工作目录时发生错误: {e}")
             return False
 
+    def _batch_subjects(self, shas: List[str]) -> Dict[str, str]:
+        """
+        通过一次git log --no-walk获取多个提交的标题，返回 {sha: 标题}
+        """
+        if not shas:
+            return {}
+        result = self.run_git_command(
+            ["git", "log", "--no-walk", "--ignore-missing", "-z", "--format=%H%x00%s", *shas, "--"]
+        )
+        if result.returncode != 0 or not result.stdout:
+            return {}
+        tokens = result.stdout.split("\x00")
+        return dict(zip(tokens[0::2], tokens[1::2]))
+
+    def _get_commit_subjects(self, shas: List[str]) -> Dict[str, str]:
+        """
+        批量获取提交标题，返回 {sha: 标题}
+        优先使用获取提交列表时记录的标题，其余一次性通过git log查询
+        """
+        missing = [sha for sha in shas if sha not in self._commit_subjects]
+        self._commit_subjects.update(self._batch_subjects(missing))
+        return {sha: self._commit_subjects.get(sha, "Unknown") for sha in shas}
+
     def run_git_command(
-        self, args: List[str], cwd: Optional[str] = None, capture_output: bool = True, env: Optional[Dict] = None
+        self,
+        args: List[str],
+        cwd: Optional[str] = None,
+        capture_output: bool = True,
+        env: Optional[Dict] = None,
+        capture_stdout: bool = True,
+        input: Optional[str] = None,
     ) -> subprocess.CompletedProcess:
         """
         运行git命令的通用方法
         在dry-run模式下，对于只读命令仍然执行以获取真实数据
         对于修改命令，只打印不执行
+        capture_stdout为False时丢弃stdout，只捕获stderr用于错误报告
+        input不为None时作为标准输入传给命令
         """
         if cwd is None:
             cwd = self.working_dir
 
+        if capture_output:
+            stdout = subprocess.PIPE if capture_stdout else subprocess.DEVNULL
+            stderr = subprocess.PIPE
+        else:
+            stdout = stderr = None
+
         if self.dry_run:
             cmd_str = " ".join(args)
             print(f"[DRY-RUN] 执行命令: {cmd_str}")
             if cwd:
                 print(f"[DRY-RUN] 工作目录: {cwd}")
 
-            # 定义只读命令列表
-            read_only_commands = {
-                "log",
-                "show",
-                "ls-remote",
-                "remote",
-                "branch",
-                "merge-base",
-                "fetch",
-                "clone",
-                "status",
-                "diff",
-                "rev-parse",
-                "symbolic-ref",
-            }
-            # 定义环境设置命令（在dry-run模式下应该执行的命令）
-            setup_commands = {"clone", "remote", "fetch"}
-
-            command = args[0] if len(args) > 0 else ""
+            # 调用方传入完整的argv（以"git"开头），子命令位于args[1]
+            command = args[1] if len(args) >= 2 and args[0] == "git" else (args[0] if args else "")
 
             # 在dry-run模式下，对于只读命令和环境设置命令仍然执行
-            if command in read_only_commands or command in setup_commands:
+            if command in _DRY_RUN_EXEC_GIT_COMMANDS:
                 try:
-                    result = subprocess.run(args, cwd=cwd, capture_output=capture_output, text=True, env=env)
-                    if result.returncode != 0 and command in setup_commands:
+                    result = subprocess.run(
+                        args, cwd=cwd, stdout=stdout, stderr=stderr, text=True, env=env, input=input
+                    )
+                    if result.returncode != 0 and command in _SETUP_GIT_COMMANDS:
                         # 对于设置命令，即使失败也继续
                         print(f"[DRY-RUN] 命令执行可能失败: {result.stderr}")
                     return result
@@ -392,13 +640,29 @@ class CherryPickBot:
                 return subprocess.CompletedProcess(args, 0, "", "")
 
         try:
-            result = subprocess.run(args, cwd=cwd, capture_output=capture_output, text=True, env=env)
+            result = subprocess.run(args, cwd=cwd, stdout=stdout, stderr=stderr, text=True, env=env, input=input)
             return result
         except Exception as e:
             print(f"❌ 执行git命令失败: {' '.join(args)}")
             print(f"   错误: {e}")
             raise
 
+    def _run_git_to_file(
+        self, args: List[str], output_file: str, input: Optional[str] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        运行git命令并将stdout直接写入文件
+        输出由git经管道直接写盘，不在Python中缓存和重新编码；失败时删除不完整的文件
+        input不为None时作为标准输入传给命令
+        """
+        with open(output_file, "wb") as f:
+            result = subprocess.run(
+                args, cwd=self.working_dir, stdout=f, stderr=subprocess.PIPE, text=True, input=input
+            )
+        if result.returncode != 0:
+            os.remove(output_file)
+        return result
+
     def check_existing_repo_alignment(self, target_repo: str) -> bool:
         """
         检查现有仓库是否与目标仓库对齐
@@ -423,11 +687,11 @@ class CherryPickBot:
                 return False
 
             print(f"📡 当前远程仓库配置:\n{self.hide_token_in_url(result.stdout)}")
+            self._remotes_cache = self._parse_remotes(result.stdout)
 
             # 检查是否已经有目标仓库的远程
-            result = self.run_git_command(["git", "remote", "get-url", "origin"])
-            if result.returncode == 0:
-                remote_url = result.stdout.strip()
+            remote_url = self._remotes_cache.get("origin")
+            if remote_url:
                 # 使用安全方式显示URL
                 safe_url = self.hide_token_in_url(remote_url)
                 print(f"✅ 已有远程仓库 origin: {safe_url}")
@@ -441,7 +705,7 @@ class CherryPickBot:
                 print(f"⚠️ 当前仓库没有origin远程")
 
             # 检查当前分支
-            result = self.run_git_command(["git", "branch", "--show-current"])
+            result = self.run_git_command(["git", "symbolic-ref", "--short", "-q", "HEAD"])
             if result.returncode == 0:
                 current_branch = result.stdout.strip()
                 print(f"🌿 当前分支: {current_branch}")
@@ -475,15 +739,15 @@ class CherryPickBot:
                 pass
 
             repo_url = self._get_repo_remote_url(self.platform, target_repo, self.token)
-            if not repo_url:
-                return False
 
             # 使用安全方式显示URL
             safe_repo_url = self.hide_token_in_url(repo_url)
             print(f"🔧 克隆目标仓库: {target_repo}")
             print(f"   仓库URL: {safe_repo_url}")
 
-            result = self.run_git_command(["git", "clone", repo_url, "."], cwd=self.working_dir)
+            result = self.run_git_command(["git", "clone", *_CLONE_OPTIONS, repo_url, "."], cwd=self.working_dir)
+            self._remotes_cache = None
+            self._default_branch = None
 
             if result.returncode == 0:
                 print(f"✅ 成功克隆仓库到: {self.working_dir}")
@@ -500,7 +764,9 @@ class CherryPickBot:
                 ssh_url = self._get_repo_remote_ssh_url(self.platform, target_repo)
 
                 print(f"🔧 尝试SSH URL: {ssh_url}")
-                result = self.run_git_command(["git", "clone", ssh_url or str(), "."], cwd=self.working_dir)
+                result = self.run_git_command(["git", "clone", *_CLONE_OPTIONS, ssh_url, "."], cwd=self.working_dir)
+                self._remotes_cache = None
+                self._default_branch = None
 
                 if result.returncode == 0:
                     print(f"✅ 成功通过SSH克隆仓库")
@@ -523,8 +789,6 @@ class CherryPickBot:
         """
         try:
             remote_url = self._get_repo_remote_url(platform, repo, token)
-            if not remote_url:
-                return False
 
             if self.dry_run:
                 print(f"[DRY-RUN] 将设置远程仓库: {remote_name}")
@@ -534,19 +798,25 @@ class CherryPickBot:
                 # 在dry-run模式下仍然尝试设置远程，以便后续命令能工作
 
             # 检查是否已存在远程仓库
-            result = self.run_git_command(["git", "remote", "get-url", remote_name])
+            current_url = self._get_remotes().get(remote_name)
 
-            if result.returncode != 0 or result.stdout != remote_url:
-                remote_cmd = "add" if result.returncode != 0 else "set-url"
+            if current_url != remote_url:
+                remote_cmd = "add" if current_url is None else "set-url"
                 # 添加远程仓库
-                result = self.run_git_command(["git", "remote", remote_cmd, remote_name, remote_url])
+                result = self.run_git_command(
+                    ["git", "remote", remote_cmd, remote_name, remote_url], capture_stdout=False
+                )
+                self._remotes_cache = None
                 if result.returncode != 0:
                     print(f"❌ 添加远程仓库失败: {result.stderr}")
 
                     # 尝试使用SSH URL
                     print(f"⚠️ HTTPS远程添加失败，尝试SSH URL...")
                     ssh_url = self._get_repo_remote_ssh_url(platform, repo)
-                    result = self.run_git_command(["git", "remote", remote_cmd, remote_name, ssh_url or str()])
+                    result = self.run_git_command(
+                        ["git", "remote", remote_cmd, remote_name, ssh_url], capture_stdout=False
+                    )
+                    self._remotes_cache = None
                     if result.returncode == 0:
                         safe_ssh_url = ssh_url
                         print(f"✅ 已通过SSH添加远程仓库: {remote_name} -> {safe_ssh_url}")
@@ -624,6 +894,37 @@ class CherryPickBot:
         except Exception as e:
             raise RuntimeError(f"通过API获取PR分支失败: {e}")
 
+    def _fetch_command(self, remote: str, *refs: str) -> List[str]:
+        """
+        构造git fetch命令
+        临时目录中的仓库本身是部分克隆，fetch时同样跳过文件内容，需要时再按需下载；
+        现有仓库不加过滤，避免修改用户仓库的promisor配置
+        """
+        args = ["git", "fetch"]
+        if self.is_temp_dir:
+            args.append("--filter=blob:none")
+        return [*args, remote, *refs]
+
+    def _find_missing_objects(self, shas: List[str]) -> List[str]:
+        """
+        通过一次git cat-file --batch-check检查对象是否已存在于本地
+        返回本地缺失的对象列表
+        """
+        # 禁止部分克隆仓库在检查时向promisor远程按需下载缺失对象
+        env = dict(os.environ, GIT_NO_LAZY_FETCH="1")
+        result = self.run_git_command(
+            ["git", "cat-file", "--batch-check"], env=env, input="".join(f"{sha}\n" for sha in shas)
+        )
+        if result.returncode != 0:
+            return list(shas)
+
+        present = set()
+        for line in result.stdout.splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and parts[1] != "missing":
+                present.add(parts[0])
+        return [sha for sha in shas if sha not in present]
+
     def get_commits_from_git(self, head_commit_sha: str, base_commit_sha: str) -> List[str]:
         """
         通过git命令获取两个commit之间的所有提交
@@ -633,39 +934,33 @@ class CherryPickBot:
                 print(f"[DRY-RUN] 将获取真实的提交信息")
             print(f"🔍 获取提交范围: {base_commit_sha[:8]}..{head_commit_sha[:8]}")
 
-            result = self.run_git_command(["git", "fetch", self.source_remote_name, base_commit_sha])
-            if result.returncode != 0:
-                raise RuntimeError(f"无法获取base commit {base_commit_sha[:8]}")
-
-            result = self.run_git_command(["git", "fetch", self.source_remote_name, head_commit_sha])
-            if result.returncode != 0:
-                raise RuntimeError(f"无法获取head commit {head_commit_sha[:8]}")
+            # 只fetch本地尚不存在的提交
+            missing = self._find_missing_objects([base_commit_sha, head_commit_sha])
+            if missing:
+                result = self.run_git_command(self._fetch_command(self.source_remote_name, *missing))
+                if result.returncode != 0:
+                    raise RuntimeError(f"无法获取提交 {', '.join(sha[:8] for sha in missing)}: {result.stderr}")
+            else:
+                print("ℹ️ 本地已存在所需提交，跳过fetch")
 
-            result = self.run_git_command(["git", "log", "--pretty=format:%H", f"{base_commit_sha}..{head_commit_sha}"])
+            # 一次git log同时取得SHA和标题，按时间正序排列
+            # 使用-z以NUL分隔，字段和记录之间均为NUL，不受标题内容影响
+            result = self.run_git_command(
+                ["git", "log", "--reverse", "-z", "--pretty=format:%H%x00%s", f"{base_commit_sha}..{head_commit_sha}"]
+            )
             if result.returncode != 0:
                 raise RuntimeError(f"获取提交列表失败: {result.stderr}")
 
-            commit_shas = [sha.strip() for sha in result.stdout.strip().split("\n") if sha.strip()]
+            tokens = result.stdout.split("\x00") if result.stdout else []
+            commits = list(zip(tokens[0::2], tokens[1::2]))
 
-            if not commit_shas:
+            if not commits:
                 raise ValueError(f"在 {base_commit_sha[:8]}..{head_commit_sha[:8]} 中未找到新提交")
 
-            if not commit_shas:
-                if self.dry_run:
-                    print(f"[DRY-RUN] 未找到新提交，使用模拟提交")
-                    return ["a1b2c3d4e5f67890123456789abcdef012345678"]
-                else:
-                    raise ValueError(f"未找到新提交")
-
-            commit_shas = list(reversed(commit_shas))
+            commit_shas = [sha for sha, _ in commits]
+            self._commit_subjects.update(commits)
 
-            print(f"📋 找到 {len(commit_shas)} 个提交:")
-            for i, commit_sha in enumerate(commit_shas, 1):
-                result = self.run_git_command(["git", "show", "-s", "--format=%s", commit_sha])
-                if result.returncode == 0:
-                    print(f"  {i}. {commit_sha[:8]} - {result.stdout.strip()}")
-                else:
-                    print(f"  {i}. {commit_sha[:8]} - (无法获取提交信息)")
+            print(f"📋 找到 {len(commit_shas)} 个提交:\n{_format_commit_listing(commits)}")
 
             return commit_shas
         except Exception as e:
@@ -675,61 +970,80 @@ class CherryPickBot:
             else:
                 raise RuntimeError(f"通过git获取提交失败: {e}")
 
-    def delete_existing_branch(self, branch_name: str) -> bool:
+    def _plan_branch_deletion(self, branch_names: List[str]) -> Tuple[List[str], List[str], str]:
         """
-        删除已存在的分支（本地和远程）
+        规划需要删除的分支
+        一次列出本地分支，并使用缓存的远程分支信息，返回 (本地待删除, 远程待删除, 远程名)
+        """
+        remote = "origin"
+        if self.personal_repo:
+            remote = self.personal_remote_name
+
+        result = self.run_git_command(["git", "for-each-ref", "--format=%(refname:strip=2)", "refs/heads/"])
+        local_branches = set(result.stdout.split()) if result.returncode == 0 else set()
+        remote_branches = self._get_remote_heads(remote) or {}
+
+        local_delete = [name for name in branch_names if name in local_branches]
+        remote_delete = [name for name in branch_names if name in remote_branches]
+        return local_delete, remote_delete, remote
+
+    def delete_existing_branches(self, branch_names: List[str]) -> bool:
+        """
+        批量删除已存在的分支（本地和远程）
+        需要确认时只询问一次，本地和远程的删除各用一条命令完成
         返回是否成功
         """
         if self.dry_run:
-            print(f"[DRY-RUN] 将删除分支: {branch_name}")
+            for branch_name in branch_names:
+                print(f"[DRY-RUN] 将删除分支: {branch_name}")
             return True
 
-        # 检查本地分支是否存在
-        result = self.run_git_command(["git", "show-ref", "--verify", f"refs/heads/{branch_name}"])
+        local_delete, remote_delete, remote = self._plan_branch_deletion(branch_names)
+        if not local_delete and not remote_delete:
+            return True
 
-        if result.returncode == 0:
-            # 本地分支存在，询问是否删除
-            if not self.auto_confirm:
-                response = input(f"❓ 本地分支 '{branch_name}' 已存在，是否删除? (y/N): ").strip().lower()
-                if response != "y":
-                    print(f"❌ 用户取消删除本地分支 '{branch_name}'")
-                    return False
+        # 分支已存在，询问是否删除
+        if not self.auto_confirm:
+            print("❓ 以下分支已存在:")
+            for branch_name in local_delete:
+                print(f"   本地分支: {branch_name}")
+            for branch_name in remote_delete:
+                print(f"   远程分支: {remote}/{branch_name}")
+            response = input("❓ 是否删除以上分支? (y/N): ").strip().lower()
+            if response != "y":
+                print("❌ 用户取消删除分支")
+                return False
 
+        if local_delete:
             # 删除本地分支
-            print(f"🗑️ 删除本地分支: {branch_name}")
-            result = self.run_git_command(["git", "branch", "-D", branch_name])
+            print(f"🗑️ 删除本地分支: {', '.join(local_delete)}")
+            result = self.run_git_command(["git", "branch", "-D", *local_delete], capture_stdout=False)
             if result.returncode != 0:
                 print(f"❌ 删除本地分支失败: {result.stderr}")
                 return False
-            print(f"✅ 本地分支 '{branch_name}' 已删除")
-
-        # 检查并删除远程分支
-        remote_to_check = "origin"
-        if self.personal_repo:
-            remote_to_check = self.personal_remote_name
-
-        result = self.run_git_command(["git", "ls-remote", "--heads", remote_to_check, branch_name])
-
-        if result.returncode == 0 and result.stdout.strip():
-            # 远程分支存在，询问是否删除
-            if not self.auto_confirm:
-                response = (
-                    input(f"❓ 远程分支 '{remote_to_check}/{branch_name}' 已存在，是否删除? (y/N): ").strip().lower()
-                )
-                if response != "y":
-                    print(f"❌ 用户取消删除远程分支 '{remote_to_check}/{branch_name}'")
-                    return False
+            print(f"✅ 本地分支已删除: {', '.join(local_delete)}")
 
+        if remote_delete:
             # 删除远程分支
-            print(f"🗑️ 删除远程分支: {remote_to_check}/{branch_name}")
-            result = self.run_git_command(["git", "push", remote_to_check, f":{branch_name}"])
+            print(f"🗑️ 删除远程分支: {', '.join(f'{remote}/{name}' for name in remote_delete)}")
+            refspecs = [f":{name}" for name in remote_delete]
+            result = self.run_git_command(["git", "push", remote, *refspecs], capture_stdout=False)
             if result.returncode != 0:
                 print(f"❌ 删除远程分支失败: {result.stderr}")
                 return False
-            print(f"✅ 远程分支 '{remote_to_check}/{branch_name}' 已删除")
+            for name in remote_delete:
+                self._remote_heads[remote].pop(name, None)
+            print(f"✅ 远程分支已删除: {', '.join(f'{remote}/{name}' for name in remote_delete)}")
 
         return True
 
+    def delete_existing_branch(self, branch_name: str) -> bool:
+        """
+        删除已存在的分支（本地和远程）
+        返回是否成功
+        """
+        return self.delete_existing_branches([branch_name])
+
     def create_branch(self, branch_name: str, based_on: str, remote: Optional[str] = None) -> bool:
         """
         安全创建分支：检查分支是否存在，如果存在则删除
@@ -746,28 +1060,33 @@ class CherryPickBot:
                 return True
 
             if remote is not None:
-                result = self.run_git_command(["git", "fetch", remote, based_on])
-                if result.returncode != 0:
-                    print(f"❌ 更新远程分支失败: {result.stderr}")
+                remote_heads = self._get_remote_heads(remote)
+                remote_sha = remote_heads.get(based_on) if remote_heads is not None else None
+                if remote_heads is not None and remote_sha is None:
+                    print(f"❌ 远程分支 {remote}/{based_on} 不存在")
                     return False
 
-                result = self.run_git_command(["git", "ls-remote", "--heads", remote, f"refs/heads/{based_on}"])
-                if result.returncode != 0 and result.stdout.strip():
-                    print(f"❌ 远程分支 {remote}/{based_on} 不存在: {result.stdout} {result.stderr}")
-                    return False
+                # 远程分支的最新提交已在本地时(例如刚克隆的就是同一仓库)跳过fetch，直接基于该提交创建分支
+                if remote_sha is not None and not self._find_missing_objects([remote_sha]):
+                    print(f"ℹ️ 本地已存在 {remote}/{based_on} 的最新提交，跳过fetch")
+                else:
+                    # 远程分支列表获取失败时同样直接fetch，由fetch报告实际错误
+                    result = self.run_git_command(self._fetch_command(remote, based_on), capture_stdout=False)
+                    if result.returncode != 0:
+                        print(f"❌ 更新远程分支失败: {result.stderr}")
+                        return False
 
-                base_branch = f"{remote}/{based_on}"
+                base_branch = remote_sha or f"{remote}/{based_on}"
             else:
-                result = self.run_git_command(["git", "show-ref", "--verify", f"refs/heads/{base_on}"])
-
+                result = self.run_git_command(["git", "rev-parse", "--verify", "-q", f"refs/heads/{based_on}"])
                 if result.returncode != 0:
-                    print(f"❌ 本地分支 {branch_name} 不存在，无法基于其创建新分支")
+                    print(f"❌ 本地分支 {based_on} 不存在，无法基于其创建新分支")
                     return False
 
                 base_branch = based_on
 
             # 创建新分支
-            result = self.run_git_command(["git", "checkout", "-b", branch_name, base_branch])
+            result = self.run_git_command(["git", "checkout", "-b", branch_name, base_branch], capture_stdout=False)
             if result.returncode != 0:
                 print(f"❌ 创建分支失败: {result.stderr}")
                 return False
@@ -778,70 +1097,100 @@ class CherryPickBot:
             print(f"❌ 创建分支时发生错误: {e}")
             return False
 
+    def _cherry_pick_head(self) -> Optional[str]:
+        """
+        读取CHERRY_PICK_HEAD，返回cherry-pick停止时正在应用的提交；没有未完成的cherry-pick时返回None
+        .git可能是文件（工作树），因此通过git rev-parse --git-path解析路径，只解析一次
+        """
+        if self._cherry_pick_head_path is None:
+            result = self.run_git_command(["git", "rev-parse", "--git-path", "CHERRY_PICK_HEAD"])
+            path = result.stdout.strip() if result.returncode == 0 else os.path.join(".git", "CHERRY_PICK_HEAD")
+            self._cherry_pick_head_path = os.path.join(self.working_dir, path)
+        try:
+            with open(self._cherry_pick_head_path, encoding="utf-8") as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            return None
+
+    def _filter_applied_commits(self, commit_shas: List[str]) -> List[str]:
+        """
+        通过一次git cherry过滤掉当前分支中已有等价修改（patch-id相同）或已包含的提交
+        范围使用PR的head和base提交，PR包含合并提交（非线性历史）时同样正确；git cherry失败时不过滤
+        """
+        head = self.pr_head_commit or commit_shas[-1]
+        base = self.pr_base_commit or f"{commit_shas[0]}^"
+        result = self.run_git_command(["git", "cherry", "HEAD", head, base])
+        if result.returncode != 0:
+            return commit_shas
+
+        # 输出格式: "+ <sha>" 尚未应用，"- <sha>" 已存在等价提交
+        # 已是HEAD祖先的提交（例如目标分支已合并PR分支）不会出现在输出中，因此只保留标记为"+"的提交
+        pending = {line[2:] for line in result.stdout.splitlines() if line.startswith("+ ")}
+        return [sha for sha in commit_shas if sha in pending]
+
     def cherry_pick_commits(self, commit_shas: List[str]) -> bool:
         """
         按顺序cherry-pick多个提交
         返回是否成功，如果冲突则返回False
+        所有提交均已存在于目标分支时返回True，并将nothing_to_pick置为True
         """
+        self.nothing_to_pick = False
         if not commit_shas:
             print("⚠️ 没有需要cherry-pick的提交")
             return False
 
+        # 一次性获取所有提交的标题
+        subjects = self._get_commit_subjects(commit_shas)
+
         if self.dry_run:
-            print(f"[DRY-RUN] 将cherry-pick以下真实的提交:")
-            for i, sha in enumerate(commit_shas, 1):
-                # 获取真实的提交信息
-                result = self.run_git_command(["git", "show", "-s", "--format=%s", sha])
-                commit_msg = result.stdout.strip() if result.returncode == 0 else "Unknown"
-                print(f"  {i}. {sha[:8]} - {commit_msg}")
+            listing = _format_commit_listing([(sha, subjects[sha]) for sha in commit_shas])
+            print(f"[DRY-RUN] 将cherry-pick以下真实的提交:\n{listing}")
             return True
 
         try:
-            success_count = 0
-            failed_commits = []
-
-            for i, commit_sha in enumerate(commit_shas, 1):
-                print(f"🍒 正在cherry-pick提交 {i}/{len(commit_shas)}: {commit_sha[:8]}")
+            # 跳过目标分支中已存在的提交（例如之前已部分cherry-pick过）
+            pending = self._filter_applied_commits(commit_shas)
+            if len(pending) < len(commit_shas):
+                skipped = "\n".join(f"  {sha[:8]} - {subjects[sha]}" for sha in commit_shas if sha not in pending)
+                print(f"ℹ️ 跳过 {len(commit_shas) - len(pending)} 个目标分支中已存在的提交:\n{skipped}")
+                if not pending:
+                    print("✅ 所有提交均已存在于目标分支，无需cherry-pick")
+                    self.nothing_to_pick = True
+                    return True
+                commit_shas = pending
 
-                # 获取提交信息
-                result = self.run_git_command(["git", "show", "-s", "--format=%s", commit_sha])
-                commit_msg = result.stdout.strip() if result.returncode == 0 else "Unknown"
-                print(f"   提交信息: {commit_msg}")
+            listing = _format_commit_listing([(sha, subjects[sha]) for sha in commit_shas])
+            print(f"🍒 正在cherry-pick {len(commit_shas)} 个提交:\n{listing}")
 
-                # 执行cherry-pick
-                result = self.run_git_command(["git", "cherry-pick", commit_sha])
+            # 一次git cherry-pick按顺序应用全部提交，遇到冲突时git自行停止
+            result = self.run_git_command(["git", "cherry-pick", *commit_shas], capture_stdout=False)
+            if result.returncode == 0:
+                print(f"🎯 cherry-pick完成: 成功 {len(commit_shas)}/{len(commit_shas)} 个提交")
+                return True
 
-                if result.returncode == 0:
-                    success_count += 1
-                    print(f"  ✅ 提交 {commit_sha[:8]} cherry-pick成功")
+            error_msg = result.stderr
+            print(f"  ❌ cherry-pick失败")
+            print(f"    错误信息: {error_msg[:200]}")
+
+            # 检查是否有冲突，CHERRY_PICK_HEAD记录了停止时的提交
+            failed_sha = self._cherry_pick_head()
+            if failed_sha:
+                print("  ⚠️ 检测到冲突，正在中止cherry-pick...")
+                # 只撤销冲突的提交，已应用的提交保留在分支上（git cherry-pick --abort会回退整个序列）
+                abort_result = self.run_git_command(["git", "reset", "--merge"], capture_stdout=False)
+                if abort_result.returncode == 0:
+                    print("  ✅ 已中止cherry-pick")
                 else:
-                    error_msg = result.stderr
-                    print(f"  ❌ 提交 {commit_sha[:8]} cherry-pick失败")
-                    print(f"    错误信息: {error_msg[:200]}")
-                    failed_commits.append((commit_sha, error_msg))
-
-                    # 检查是否有冲突
-                    if "conflict" in error_msg.lower():
-                        print("  ⚠️ 检测到冲突，正在中止cherry-pick...")
-                        abort_result = self.run_git_command(["git", "cherry-pick", "--abort"])
-                        if abort_result.returncode == 0:
-                            print("  ✅ 已中止cherry-pick")
-                        else:
-                            print(f"  ❌ 中止cherry-pick失败: {abort_result.stderr}")
-
-                    # 询问是否继续
-                    print(f"\n❌ cherry-pick冲突，无法继续。")
-                    print(f"   请手动解决冲突后继续。")
-                    print(f"   冲突提交: {commit_sha[:8]} - {commit_msg}")
-                    return False
-
-            if failed_commits:
-                print(f"\n⚠️ 有 {len(failed_commits)} 个提交cherry-pick失败:")
-                for sha, error in failed_commits:
-                    print(f"  - {sha[:8]}: {error[:100]}...")
-
-            print(f"🎯 cherry-pick完成: 成功 {success_count}/{len(commit_shas)} 个提交")
-            return success_count > 0
+                    print(f"  ❌ 中止cherry-pick失败: {abort_result.stderr}")
+            # 清除多提交cherry-pick遗留的序列状态
+            self.run_git_command(["git", "cherry-pick", "--quit"], capture_stdout=False)
+
+            print(f"\n❌ cherry-pick冲突，无法继续。")
+            print(f"   请手动解决冲突后继续。")
+            if failed_sha in subjects:
+                print(f"   已成功应用 {commit_shas.index(failed_sha)}/{len(commit_shas)} 个提交")
+                print(f"   冲突提交: {failed_sha[:8]} - {subjects[failed_sha]}")
+            return False
 
         except KeyboardInterrupt:
             print("\n⏹️ 用户中断操作")
@@ -885,33 +1234,26 @@ class CherryPickBot:
             return False
 
         # 如果提供了pr_info，使用其中的标题和描述
-        pr_title = ""
-        pr_body = ""
-
         if not pr_info:
             pr_info = self.get_pr_info_from_api()
 
         # 使用自定义标题前缀或默认前缀
         prefix = title_prefix or "Cherry-pick:"
         pr_title = f"{prefix} {pr_info.get('title', f'PR #{self.pr_number}')}"
-        pr_body = pr_info.get("body", f"自动cherry-pick自 {self.pr_url}")
-
-        # 添加cherry-pick说明
-        cherry_pick_note = str()
+        # 源PR没有描述时API返回null
+        pr_body = pr_info.get("body") or f"自动cherry-pick自 {self.pr_url}"
 
-        # 添加自定义描述尾部
+        # 添加自定义描述尾部，超出PR描述最大长度时不追加
         if body_tail:
-            format_args = dict(
+            tail = body_tail.format(
                 platform=self.platform,
                 target_repo=self.target_repo,
                 pr_number=self.pr_number,
                 personal_repo=self.personal_repo or self.target_repo,
                 pr_url=self.pr_url,
             )
-            cherry_pick_note = f"\n\n{body_tail.format(**format_args)}"
-
-        if len(pr_body) + len(cherry_pick_note) < 65536:  # GitHub PR body 最大长度
-            pr_body += cherry_pick_note
+            if len(pr_body) + len(tail) + 2 < _PR_BODY_MAX_LENGTH:
+                pr_body = f"{pr_body}\n\n{tail}"
 
         try:
             return self._create_platform_pr(
@@ -951,7 +1293,8 @@ class CherryPickBot:
             print(f"  标题: {pr_title}")
             print(f"  描述长度: {len(pr_body)} 字符")
 
-            response = requests.post(api_url, headers=headers, json=data)
+            # 复用会话的连接池；POST不在自动重试范围内，不会重复创建PR
+            response = self._session.post(api_url, headers=headers, json=data, timeout=_API_TIMEOUT)
             response.raise_for_status()
 
             pr_info = response.json()
@@ -960,10 +1303,22 @@ class CherryPickBot:
 
         except requests.RequestException as e:
             print(f"❌ 创建 {platform} PR失败: {e}")
-            if response.text:
-                print(f"错误详情: {response.text}")
+            if e.response is not None and e.response.text:
+                print(f"错误详情: {e.response.text}")
             return False
 
+    @staticmethod
+    def _patch_revisions(commit_shas: List[str]) -> Tuple[List[str], Optional[str]]:
+        """
+        生成git format-patch的提交参数和标准输入，返回 (参数, 标准输入)
+        多个提交时经stdin逐个列出，提交不连续时同样只需一次git format-patch；
+        format-patch按与输入相反的顺序输出，因此倒序写入，使patch编号与commit_shas的顺序一致
+        """
+        if len(commit_shas) == 1:
+            # 单个提交必须使用-1，否则会被当作"自该提交以来"的范围
+            return ["-1", commit_shas[0]], None
+        return ["--no-walk=unsorted", "--stdin"], "".join(f"{sha}\n" for sha in reversed(commit_shas))
+
     def generate_patch_file(self, commit_shas: List[str], patch_file: str) -> bool:
         """
         生成patch文件
@@ -973,63 +1328,49 @@ class CherryPickBot:
             return False
 
         if self.dry_run:
-            print(f"[DRY-RUN] 将为 {len(commit_shas)} 个提交生成patch文件: {patch_file}")
-            for i, sha in enumerate(commit_shas, 1):
-                result = self.run_git_command(["git", "show", "-s", "--format=%s", sha])
-                commit_msg = result.stdout.strip() if result.returncode == 0 else "Unknown"
-                print(f"  {i}. {sha[:8]} - {commit_msg}")
+            # 一次性获取所有提交的标题
+            subjects = self._get_commit_subjects(commit_shas)
+            listing = _format_commit_listing([(sha, subjects[sha]) for sha in commit_shas])
+            print(f"[DRY-RUN] 将为 {len(commit_shas)} 个提交生成patch文件: {patch_file}\n{listing}")
             return True
 
         try:
             print(f"📁 为 {len(commit_shas)} 个提交生成patch文件: {patch_file}")
 
-            patch_dir = os.path.dirname(patch_file)
-            if patch_dir and not os.path.exists(patch_dir):
+            # 以路径分隔符结尾时无需stat即可确定是目录，否则最多stat一次
+            wants_dir = patch_file.endswith(("/", "\\")) or os.path.isdir(patch_file)
+            patch_dir = patch_file.rstrip("/").rstrip("\\") if wants_dir else os.path.dirname(patch_file)
+            if patch_dir:
                 os.makedirs(patch_dir, exist_ok=True)
 
-            if os.path.isdir(patch_file) or patch_file.endswith("/") or patch_file.endswith("\\"):
-                patch_dir = patch_file.rstrip("/").rstrip("\\")
-                if not os.path.exists(patch_dir):
-                    os.makedirs(patch_dir, exist_ok=True)
-
+            if wants_dir:
                 print(f"📁 将在目录中为每个提交生成单独的patch文件: {patch_dir}")
 
-                for i, commit_sha in enumerate(commit_shas, 1):
-                    result = self.run_git_command(["git", "show", "-s", "--format=%s", commit_sha])
-                    commit_msg = result.stdout.strip() if result.returncode == 0 else "Unknown"
-                    print(f"📄 为提交 {i}/{len(commit_shas)} 生成patch: {commit_sha[:8]} - {commit_msg}")
-
-                    patch_num = f"{i:04d}"
-                    sanitized_msg = re.sub(r"[^\w\s-]", "", commit_msg)[:50]
-                    sanitized_msg = re.sub(r"[-\s]+", "-", sanitized_msg)
-                    single_patch = os.path.join(patch_dir, f"{patch_num}-{sanitized_msg}.patch")
+                # 一次git format-patch生成全部patch，文件编号和命名由git完成
+                # git在工作目录中执行，输出目录需使用绝对路径
+                revision_args, revision_input = self._patch_revisions(commit_shas)
+                result = self.run_git_command(
+                    ["git", "format-patch", "-o", os.path.abspath(patch_dir), *revision_args], input=revision_input
+                )
+                if result.returncode != 0:
+                    print(f"  ❌ 生成patch失败: {result.stderr}")
+                    return False
 
-                    result = self.run_git_command(["git", "format-patch", "-1", "--stdout", commit_sha])
-                    if result.returncode == 0:
-                        with open(single_patch, "w", encoding="utf-8") as f:
-                            f.write(result.stdout)
-                        print(f"  ✅ 已生成patch: {single_patch}")
-                    else:
-                        print(f"  ❌ 生成patch失败: {result.stderr}")
-                        return False
+                print("\n".join(f"  ✅ 已生成patch: {single_patch}" for single_patch in result.stdout.splitlines()))
 
                 print(f"✅ 已为 {len(commit_shas)} 个提交生成patch文件到目录: {patch_dir}")
                 return True
             else:
                 print(f"📄 生成包含所有提交的单个patch文件: {patch_file}")
 
-                if len(commit_shas) == 1:
-                    result = self.run_git_command(["git", "format-patch", "-1", "--stdout", commit_shas[0]])
-                else:
-                    result = self.run_git_command(
-                        ["git", "format-patch", f"{commit_shas[0]}^..{commit_shas[-1]}", "--stdout"]
-                    )
+                revision_args, revision_input = self._patch_revisions(commit_shas)
+                result = self._run_git_to_file(
+                    ["git", "format-patch", "--stdout", *revision_args], patch_file, input=revision_input
+                )
 
                 if result.returncode == 0:
-                    with open(patch_file, "w", encoding="utf-8") as f:
-                        f.write(result.stdout)
                     print(f"✅ 已生成patch文件: {patch_file}")
-                    print(f"   文件大小: {len(result.stdout)} 字节")
+                    print(f"   文件大小: {os.path.getsize(patch_file)} 字节")
                     return True
                 else:
                     print(f"❌ 生成patch失败: {result.stderr}")
@@ -1052,48 +1393,56 @@ class CherryPickBot:
             return True
 
         try:
-            # 确定推送到哪个远程
-            if self.personal_repo:
-                remote = self.personal_remote_name
-                remote_name = f"个人仓库 ({self.personal_repo})"
-            else:
-                remote = self.source_remote_name
-                remote_name = "原始仓库"
+            target = self._get_push_target()
+            push_args = ["git", "push", "--set-upstream", target.remote, branch]
 
-            print(f"📤 推送更改到{remote_name}分支: {branch}")
+            print(f"📤 推送更改到{target.label}分支: {branch}")
+
+            # 之前通过SSH推送成功的仓库直接使用SSH，跳过HTTPS尝试和SSH探测
+            if self._get_push_transport(target.transport_key) == "ssh":
+                self._set_remote_ssh_url(target.remote, target.repo)
+                result = self.run_git_command(push_args, capture_stdout=False)
+                if result.returncode == 0:
+                    self._remote_heads.pop(target.remote, None)
+                    print(f"✅ SSH推送成功: {target.remote}/{branch}")
+                    return True
+
+                # 记录已失效，恢复HTTPS远程后按正常流程重试
+                print(f"⚠️ SSH推送失败，改用HTTPS推送: {result.stderr}")
+                self._set_push_transport(target.transport_key, None)
+                if not self.setup_remote(target.remote, self.platform, target.repo, self.token):
+                    return False
 
             # 执行推送
-            result = self.run_git_command(["git", "push", "--set-upstream", remote, branch])
+            result = self.run_git_command(push_args, capture_stdout=False)
 
             if result.returncode == 0:
-                print(f"✅ 推送成功: {remote}/{branch}")
+                self._remote_heads.pop(target.remote, None)
+                self._set_push_transport(target.transport_key, None)
+                print(f"✅ 推送成功: {target.remote}/{branch}")
                 return True
             else:
                 error_msg = result.stderr
-                print(f"❌ 推送到{remote_name}失败: {error_msg}")
+                print(f"❌ 推送到{target.label}失败: {error_msg}")
 
                 # 尝试使用SSH推送
                 print(f"⚠️ HTTPS推送失败，尝试使用SSH推送...")
 
                 # 检查是否配置了SSH密钥
-                ssh_test_cmd = ["ssh", "-T", f"git@{self._get_remote_domain(self.platform)}"]
+                ssh_test_cmd = ["ssh", "-T", f"git@{target.domain}"]
                 ssh_result = self.run_git_command(ssh_test_cmd, capture_output=True)
                 if ssh_result.returncode == 1 and "successfully authenticated" in ssh_result.stderr.lower():
                     print(f"✅ SSH密钥配置正确，尝试SSH推送")
 
-                    # 获取当前远程URL
-                    result = self.run_git_command(["git", "remote", "get-url", remote])
-                    if result.returncode == 0:
-                        # 如果是HTTPS URL，转换为SSH URL
-                        ssh_url = self._get_repo_remote_ssh_url(self.platform, self.personal_repo or self.target_repo)
-                        # 设置SSH远程URL
-                        self.run_git_command(["git", "remote", "set-url", remote, ssh_url or str()])
-                        print(f"✅ 已设置为SSH远程: {ssh_url}")
+                    # 如果是HTTPS URL，转换为SSH URL
+                    self._set_remote_ssh_url(target.remote, target.repo)
 
                     # 重新尝试推送
-                    result = self.run_git_command(["git", "push", "--set-upstream", remote, branch])
+                    result = self.run_git_command(push_args, capture_stdout=False)
                     if result.returncode == 0:
-                        print(f"✅ SSH推送成功: {remote}/{branch}")
+                        self._remote_heads.pop(target.remote, None)
+                        self._set_push_transport(target.transport_key, "ssh")
+                        print(f"✅ SSH推送成功: {target.remote}/{branch}")
                         return True
                     else:
                         print(f"❌ SSH推送也失败: {result.stderr}")
@@ -1107,6 +1456,45 @@ class CherryPickBot:
             print(f"❌ 推送过程中发生错误: {e}")
             return False
 
+    def _get_push_target(self) -> _PushTarget:
+        """
+        获取推送目标：指定了个人仓库时推送到个人仓库，否则推送到PR源仓库
+        远程设置完成后确定，之后复用
+        """
+        if self._push_target is None:
+            domain = self._get_remote_domain(self.platform)
+            if self.personal_repo:
+                self._push_target = _PushTarget(
+                    self.personal_remote_name, f"个人仓库 ({self.personal_repo})", self.personal_repo, domain
+                )
+            else:
+                self._push_target = _PushTarget(self.source_remote_name, "原始仓库", self.target_repo, domain)
+        return self._push_target
+
+    def _set_remote_ssh_url(self, remote: str, repo: str):
+        """将已存在的远程设置为SSH URL"""
+        if remote in self._get_remotes():
+            ssh_url = self._get_repo_remote_ssh_url(self.platform, repo)
+            self.run_git_command(["git", "remote", "set-url", remote, ssh_url], capture_stdout=False)
+            self._remotes_cache = None
+            print(f"✅ 已设置为SSH远程: {ssh_url}")
+
+    def _get_push_transport(self, key: str) -> Optional[str]:
+        """获取推送目标上次成功使用的传输方式，记录只在首次使用时读取"""
+        if self._push_transports is None:
+            self._push_transports = _load_push_transports()
+        return self._push_transports.get(key)
+
+    def _set_push_transport(self, key: str, transport: Optional[str]):
+        """更新推送目标的传输方式记录，transport为None时删除记录；只在记录变化时写文件"""
+        if self._get_push_transport(key) == transport:
+            return
+        if transport is None:
+            self._push_transports.pop(key, None)
+        else:
+            self._push_transports[key] = transport
+        _save_push_transports(self._push_transports)
+
     def run(
         self,
         pr_url: str,
@@ -1158,55 +1546,88 @@ class CherryPickBot:
                 print(f"❌ 解析PR链接失败: {e}")
                 return False
 
-            # 3. 克隆或初始化仓库
-            self.target_repo = target_repo or f"{owner}/{repo}"
-            if not self.clone_or_init_repo(self.target_repo):
-                print("❌ 克隆/初始化仓库失败")
-                return False
+            # 通过API获取PR详细信息与克隆、设置远程互不依赖，在后台线程中并行执行
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                api_future = executor.submit(self.get_pr_info_from_api_extended)
 
-            # 4. 设置源仓库远程
-            if not self.setup_source_remote():
-                print("❌ 设置源仓库远程失败")
-                return False
+                # 3. 克隆或初始化仓库
+                self.target_repo = target_repo or f"{owner}/{repo}"
+                if not self.clone_or_init_repo(self.target_repo):
+                    print("❌ 克隆/初始化仓库失败")
+                    return False
 
-            # 5. 设置个人仓库远程（如果指定了个人仓库）
-            if personal_repo:
-                self.personal_repo = personal_repo
-                if not self.setup_personal_remote():
-                    print("⚠️ 设置个人仓库远程失败，将继续使用原始仓库")
-                    self.personal_repo = None
+                # 4. 设置源仓库远程
+                if not self.setup_source_remote():
+                    print("❌ 设置源仓库远程失败")
+                    return False
 
-            # 6. 通过API获取PR详细信息（包括分支名和commit SHA）
-            try:
-                pr_info_extended = self.get_pr_info_from_api_extended()
-                head_ref = pr_info_extended["head_ref"]
-                base_ref = pr_info_extended["base_ref"]
-                head_commit_sha = pr_info_extended["head_commit_sha"]
-                base_commit_sha = pr_info_extended["base_commit_sha"]
-
-                # 更新实例变量
-                self.pr_head_ref = head_ref
-                self.pr_base_ref = base_ref
-                self.pr_head_commit = head_commit_sha
-                self.pr_base_commit = base_commit_sha
-
-                print(f"🔍 获取PR详细信息成功")
-                print(f"  Head分支: {head_ref} (commit: {head_commit_sha[:8]})")
-                print(f"  Base分支: {base_ref} (commit: {base_commit_sha[:8]})")
-
-            except Exception as e:
-                print(f"❌ 获取PR详细信息失败: {e}")
-                return False
+                # 5. 设置个人仓库远程（如果指定了个人仓库）
+                if personal_repo:
+                    self.personal_repo = personal_repo
+                    if not self.setup_personal_remote():
+                        print("⚠️ 设置个人仓库远程失败，将继续使用原始仓库")
+                        self.personal_repo = None
+                # 推送目标取决于最终是否使用个人仓库，重新确定
+                self._push_target = None
+
+                # 未指定目标分支时使用目标仓库的默认分支
+                if not target_branch:
+                    target_branch = self.default_branch
+                    if not target_branch:
+                        print("❌ 未指定目标分支，且无法获取目标仓库的默认分支")
+                        return False
+                    print(f"ℹ️ 未指定目标分支，使用默认分支: {target_branch}")
 
-            # 7. 通过git命令获取提交信息（基于commit SHA）
-            try:
-                commit_shas = self.get_commits_from_git(head_commit_sha, base_commit_sha)
-                if not commit_shas:
-                    print("❌ 未找到有效的提交信息")
+                # 远程设置会写.git/config，只能串行；设置完成后，创建分支和推送所需的远程分支列表
+                # (git ls-remote，只读且受网络延迟限制)在后台预取，与获取PR信息和提交并行
+                heads_futures = {}
+                if not self.dry_run:
+                    push_remote = self.personal_remote_name if self.personal_repo else "origin"
+                    for remote in dict.fromkeys([push_remote, self.source_remote_name]):
+                        heads_futures[remote] = executor.submit(self._get_remote_heads, remote)
+
+                # 6. 通过API获取PR详细信息（包括分支名和commit SHA）
+                try:
+                    pr_info_extended = api_future.result()
+                    head_ref = pr_info_extended["head_ref"]
+                    base_ref = pr_info_extended["base_ref"]
+                    head_commit_sha = pr_info_extended["head_commit_sha"]
+                    base_commit_sha = pr_info_extended["base_commit_sha"]
+
+                    # 更新实例变量
+                    self.pr_head_ref = head_ref
+                    self.pr_base_ref = base_ref
+                    self.pr_head_commit = head_commit_sha
+                    self.pr_base_commit = base_commit_sha
+
+                    print(f"🔍 获取PR详细信息成功")
+                    print(f"  Head分支: {head_ref} (commit: {head_commit_sha[:8]})")
+                    print(f"  Base分支: {base_ref} (commit: {base_commit_sha[:8]})")
+
+                except Exception as e:
+                    print(f"❌ 获取PR详细信息失败: {e}")
+                    return False
+
+                # 提交范围和目标分支的最新提交合并为一次fetch，获取提交和创建分支时无需再各自fetch
+                # 失败时不中断，由后续步骤自行fetch并报告错误
+                wanted = [base_commit_sha, head_commit_sha]
+                if self.source_remote_name in heads_futures:
+                    target_tip = (heads_futures[self.source_remote_name].result() or {}).get(target_branch)
+                    if target_tip:
+                        wanted.append(target_tip)
+                missing = self._find_missing_objects(wanted)
+                if missing:
+                    self.run_git_command(self._fetch_command(self.source_remote_name, *missing), capture_stdout=False)
+
+                # 7. 通过git命令获取提交信息（基于commit SHA）
+                try:
+                    commit_shas = self.get_commits_from_git(head_commit_sha, base_commit_sha)
+                    if not commit_shas:
+                        print("❌ 未找到有效的提交信息")
+                        return False
+                except Exception as e:
+                    print(f"❌ 获取提交信息失败: {e}")
                     return False
-            except Exception as e:
-                print(f"❌ 获取提交信息失败: {e}")
-                return False
 
             # 8. 如果指定了patch_file，生成patch文件
             if patch_file:
@@ -1221,11 +1642,9 @@ class CherryPickBot:
             # 9. 创建cherry-pick分支
             if not source_branch_name:
                 # 新分支名格式：cherry-pick-pr-{pr_num}-to-{target_branch}
-                # 清理目标分支名中的非法字符
+                # 清理目标分支名中的非法字符，斜杠同样替换为短横线
                 if target_branch:
-                    clean_target_branch = re.sub(r"[^\w\-/]", "-", target_branch)
-                    # 将斜杠替换为短横线
-                    clean_target_branch = clean_target_branch.replace("/", "-")
+                    clean_target_branch = _SANITIZE_BRANCH.sub("-", target_branch)
                     source_branch_name = f"cherry-pick-pr-{pr_num}-to-{clean_target_branch}"
                 else:
                     source_branch_name = f"cherry-pick-pr-{pr_num}"
@@ -1244,6 +1663,11 @@ class CherryPickBot:
                 print(f"   提交: {commit_shas[0][:8]} 等")
                 return False
 
+            # 所有提交均已存在于目标分支，新分支与目标分支相同，推送和创建PR没有意义
+            if self.nothing_to_pick:
+                print(f"ℹ️ 目标分支 {target_branch} 已包含PR的全部提交，无需推送或创建PR")
+                return True
+
             # 12. 推送更改
             if not self.push_changes(source_branch_name):
                 print("❌ 推送更改失败")
@@ -1251,14 +1675,11 @@ class CherryPickBot:
 
             # 13. 自动创建PR（如果启用）
             if create_pr:
-                try:
-                    pr_info = self.get_pr_info_from_api()
-                    print(f"📄 获取源PR信息成功")
-                    print(f"  标题: {pr_info.get('title', 'N/A')}")
-                    print(f"  描述长度: {len(pr_info.get('body', ''))} 字符")
-                except Exception as e:
-                    print(f"⚠️ 获取源PR信息失败: {e}")
-                    print(f"⚠️ 创建PR时将使用默认标题和描述")
+                # 复用第6步通过API获取的源PR信息，不再重复请求
+                pr_info = pr_info_extended["pr_info"]
+                print(f"📄 源PR信息")
+                print(f"  标题: {pr_info.get('title') or 'N/A'}")
+                print(f"  描述长度: {len(pr_info.get('body') or '')} 字符")
 
                 if not self.create_pull_request(
                     self.target_repo, target_branch, source_branch_name, pr_info, title_prefix, body_tail
@@ -1344,7 +1765,7 @@ def main():
         "-s", "--source-branch-name", help="源分支名称 (默认: 自动生成，格式: cherry-pick-pr-<pr号>-to-<目标分支>)"
     )
     parser.add_argument("--target-repo", help="目标仓库 (格式: owner/repo, 默认: 与源PR相同)")
-    parser.add_argument("--target-branch", help="目标分支名称")
+    parser.add_argument("--target-branch", help="目标分支名称 (默认: 目标仓库的默认分支)")
     parser.add_argument("--personal-repo", help="个人仓库 (fork仓库) (格式: owner/repo, 用于推送分支和创建PR)")
     parser.add_argument("--create-pr", action="store_true", help="自动创建PR")
     parser.add_argument("--title-prefix", help="PR标题前缀 (默认: 'Cherry-pick:')")
@@ -1363,21 +1784,20 @@ def main():
             print(f"✅ 从环境变量 {args.token_env_var} 获取token")
 
     # 创建机器人实例并运行
-    bot = CherryPickBot(token=token, dry_run=args.dry_run, auto_confirm=args.yes)
-
-    success = bot.run(
-        pr_url=args.pr_url,
-        target_branch=args.target_branch,
-        repo_path=args.repo_path,
-        target_repo=args.target_repo,
-        personal_repo=args.personal_repo,
-        create_pr=args.create_pr,
-        source_branch_name=args.source_branch_name,
-        token=token,
-        title_prefix=args.title_prefix,
-        body_tail=args.body_tail,
-        patch_file=args.patch,
-    )
+    with CherryPickBot(token=token, dry_run=args.dry_run, auto_confirm=args.yes) as bot:
+        success = bot.run(
+            pr_url=args.pr_url,
+            target_branch=args.target_branch,
+            repo_path=args.repo_path,
+            target_repo=args.target_repo,
+            personal_repo=args.personal_repo,
+            create_pr=args.create_pr,
+            source_branch_name=args.source_branch_name,
+            token=token,
+            title_prefix=args.title_prefix,
+            body_tail=args.body_tail,
+            patch_file=args.patch,
+        )
 
     sys.exit(0 if success else 1)
 
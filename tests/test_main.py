@@ -0,0 +1,135 @@
+import subprocess
+
+import pytest
+
+from main import _LISTING_MAX_LINES, CherryPickBot, _format_commit_listing
+
+
+def _git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """带有一个提交和feature分支的本地仓库"""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "--allow-empty", "-m", "initial")
+    _git(tmp_path, "branch", "feature")
+    return tmp_path
+
+
+def _commit(cwd, message):
+    """提交一个修改文件message.txt的提交，返回其SHA"""
+    (cwd / f"{message}.txt").write_text(message)
+    _git(cwd, "add", f"{message}.txt")
+    _git(cwd, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", message)
+    return _git(cwd, "rev-parse", "HEAD").strip()
+
+
+@pytest.fixture
+def bot(repo):
+    bot = CherryPickBot()
+    bot.working_dir = str(repo)
+    yield bot
+    bot.cleanup()
+
+
+@pytest.fixture
+def dry_run_bot(repo):
+    bot = CherryPickBot(dry_run=True)
+    bot.working_dir = str(repo)
+    yield bot
+    bot.cleanup()
+
+
+def test_dry_run_executes_read_only_command(dry_run_bot):
+    result = dry_run_bot.run_git_command(["git", "log", "-1", "--format=%s"])
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == "initial"
+
+
+def test_dry_run_simulates_push(dry_run_bot):
+    # 仓库没有origin远程，实际执行会失败
+    result = dry_run_bot.run_git_command(["git", "push", "origin", "main"])
+
+    assert isinstance(result, subprocess.CompletedProcess)
+    assert (result.returncode, result.stdout, result.stderr) == (0, "", "")
+
+
+def test_dry_run_simulates_branch(dry_run_bot, repo):
+    # git branch可以删除分支，dry-run模式下不能实际执行
+    result = dry_run_bot.run_git_command(["git", "branch", "-D", "feature"])
+
+    assert (result.returncode, result.stdout, result.stderr) == (0, "", "")
+    assert "feature" in _git(repo, "branch", "--list", "feature")
+
+
+def test_failed_ls_remote_is_not_cached(dry_run_bot, repo, tmp_path_factory):
+    missing = tmp_path_factory.mktemp("remote") / "missing"
+    _git(repo, "remote", "add", "broken", str(missing))
+
+    assert dry_run_bot._get_remote_heads("broken") is None
+    assert "broken" not in dry_run_bot._remote_heads
+
+    # 远程可用后重新获取
+    _git(repo, "clone", "-q", "--bare", str(repo), str(missing))
+    assert dry_run_bot._get_remote_heads("broken") == {
+        "feature": _git(repo, "rev-parse", "feature").strip(),
+        "main": _git(repo, "rev-parse", "main").strip(),
+    }
+
+
+@pytest.mark.parametrize("count", [1, _LISTING_MAX_LINES, _LISTING_MAX_LINES + 1, 2 * _LISTING_MAX_LINES - 1, 1001])
+def test_commit_listing_is_bounded(count):
+    commits = [(f"{i:040x}", f"commit {i}") for i in range(1, count + 1)]
+    commit_lines = [line for line in _format_commit_listing(commits).splitlines() if not line.startswith("  (")]
+
+    # 抽样的行数不超过上限，另外总是包含首尾提交
+    assert len(commit_lines) <= min(count, _LISTING_MAX_LINES + 2)
+    assert commit_lines[0].startswith("  1. ")
+    assert commit_lines[-1].startswith(f"  {count}. ")
+
+
+def test_cherry_pick_skips_commits_merged_into_target(bot, repo, monkeypatch):
+    base = _git(repo, "rev-parse", "main").strip()
+    _git(repo, "checkout", "-q", "feature")
+    commits = [_commit(repo, "first"), _commit(repo, "second")]
+    _git(repo, "checkout", "-q", "main")
+    _git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "merge", "-q", "--no-ff", "-m", "merge", "feature")
+    bot.pr_head_commit, bot.pr_base_commit = commits[-1], base
+
+    commands = []
+    run_git_command = bot.run_git_command
+
+    def record(args, *rest, **kwargs):
+        commands.append(args[1:3])
+        return run_git_command(args, *rest, **kwargs)
+
+    monkeypatch.setattr(bot, "run_git_command", record)
+
+    assert bot.cherry_pick_commits(commits)
+    assert bot.nothing_to_pick
+    assert not any(args[0] == "cherry-pick" for args in commands)
+
+
+@pytest.fixture
+def non_contiguous_commits(repo):
+    """三个连续提交中的第一个和第三个"""
+    first, _, third = (_commit(repo, message) for message in ("first", "second", "third"))
+    return [first, third]
+
+
+def test_patch_directory_follows_commit_order(bot, non_contiguous_commits, tmp_path_factory):
+    patch_dir = tmp_path_factory.mktemp("patches")
+
+    assert bot.generate_patch_file(non_contiguous_commits, f"{patch_dir}/")
+    assert sorted(path.name for path in patch_dir.iterdir()) == ["0001-first.patch", "0002-third.patch"]
+
+
+def test_patch_file_follows_commit_order(bot, non_contiguous_commits, tmp_path_factory):
+    patch_file = tmp_path_factory.mktemp("patches") / "all.patch"
+
+    assert bot.generate_patch_file(non_contiguous_commits, str(patch_file))
+    subjects = [line for line in patch_file.read_text().splitlines() if line.startswith("Subject: ")]
+    assert subjects == ["Subject: [PATCH 1/2] first", "Subject: [PATCH 2/2] third"]